@@ -28,40 +28,131 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import calendar
-from io import BytesIO, StringIO
-import itertools
+import codecs
+import functools
+from io import BytesIO, StringIO, TextIOWrapper
+import os
 from os import PathLike
 from pathlib import Path
 import re
-from typing import Any, Dict, Iterator, List, Literal, Optional, Pattern, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
 import warnings
 
 
 __version__ = '0.4.0'
 
 
+# Default number of bytes to read (and feed to the detector) at a time in
+# `detect_encoding()`
+_DETECT_CHUNK_SIZE: int = 16384
+
+# Default cap on the number of bytes `detect_encoding()` reads: chardet often
+# never reaches its confidence threshold on plain-ASCII files, which would
+# otherwise mean scanning the entire file
+_DETECT_MAX_BYTES: int = 64 * 1024
+
+# Buffer size for files opened by `WEO`: WEO datasets are multi-MB TSVs, so a
+# large buffer means far fewer read() syscalls than Python's (8 KiB) default
+_IO_BUFSIZE: int = 1 << 20
+
+# Mapping: Byte-order marks to encodings, longest first (the UTF-32 marks
+#          must precede 'utf-16le', with which they share a two-byte prefix)
+_BOM_ENCODINGS: Dict[bytes, str] = {
+    b'\xff\xfe\x00\x00': 'utf-32le',
+    b'\x00\x00\xfe\xff': 'utf-32be',
+    b'\xef\xbb\xbf': 'utf-8-sig',
+    b'\xff\xfe': 'utf-16le',
+    b'\xfe\xff': 'utf-16be',
+}
+
+# Flag: Set to False to silence the low-confidence warning in
+# `detect_encoding()` (skipping construction of the warning message
+# entirely) e.g. in bulk scans over files known to be plain ASCII
+WARN_ON_LOW_CONFIDENCE: bool = True
+
+# Cache: Incremental encoding-detector class, resolved on first use by
+# `_get_detector_cls()`
+_DETECTOR_CLS: Optional[type] = None
+
+# Cache: `detect_encoding()` results for file paths, keyed on the path, stat
+# fields (so entries invalidate if the file changes) and read bounds
+_DETECT_CACHE: Dict[Tuple, Dict[str, Any]] = {}
+
+
+def _get_detector_cls() -> type:
+    """Return (and cache) the incremental detector class for `detect_encoding()`.
+
+    Prefer `cchardet` (a drop-in C implementation of the same API, roughly an
+    order of magnitude faster) when installed; otherwise fall back to
+    `chardet`.
+    """
+    global _DETECTOR_CLS
+
+    if _DETECTOR_CLS is None:
+        try:
+            from cchardet import UniversalDetector
+        except ImportError:
+            from chardet.universaldetector import UniversalDetector
+
+        _DETECTOR_CLS = UniversalDetector
+
+    return _DETECTOR_CLS
+
+
+@functools.lru_cache(maxsize=256)
+def _sniff_path_bom(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Return the encoding implied by a byte-order mark at the start of `path`, if any.
+
+    The stat fields, `mtime_ns` and `size`, key the cache alongside the path,
+    so that repeated sniffs of an unchanged file skip the read while a
+    modified file still invalidates its entry.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        head = f.read(4)
+
+    for bom, bom_encoding in _BOM_ENCODINGS.items():
+        if head.startswith(bom):
+            return bom_encoding
+
+    return None
+
+
 def detect_encoding(
     path_or_buffer: Union[str, bytes, PathLike, BytesIO],
     *,
-    min_lines: int = 1,
-    max_lines: int = 0,
+    min_bytes: int = 1,
+    max_bytes: int = 0,
+    chunk_size: int = _DETECT_CHUNK_SIZE,
 ) -> Dict[str, Any]:
-    """Return the detected file encoding of `path_or_buffer`. **Requires `chardet`**.
+    """Return the detected file encoding of `path_or_buffer`. **Requires `chardet` (or `cchardet`)**.
 
     Parameters
     ----------
     path_or_buffer : pathlike or bytes buffer
         File (pathlike to open as bytes buffer) or filelike (bytes buffer) to
         read. **Cannot** be a str buffer.
-    min_lines : int, default 1
-        Minimum number of lines to read from `path_or_buffer`.
-    max_lines : int, default 0
-        Maximum number of lines to read from `path_or_buffer`.
+    min_bytes : int, default 1
+        Minimum number of bytes to read from `path_or_buffer`.
+    max_bytes : int, default 0
+        Maximum number of bytes to read from `path_or_buffer`.
         Special cases:
-          0: Read as many lines as needed to confidently detect the file
-             encoding
+          0: Read up to a default cap (64 KiB), stopping earlier if the
+             encoding has been confidently detected
          -1: Read the entire file/buffer
+    chunk_size : int, default 16384
+        Number of bytes to read (and feed to the detector) at a time.
 
     Returns
     -------
@@ -73,58 +164,338 @@ def detect_encoding(
 
     Notes
     -----
-    This function raises a warning if confidence in the detected encoding is
-    too low.
+    If the detected encoding is ASCII (or nothing was detected at all, as
+    often happens for plain-ASCII files under a bounded read), this function
+    returns 'utf-8', of which ASCII is a subset.
+
+    Otherwise, this function raises a warning if confidence in the detected
+    encoding is too low.
+
+    If `path_or_buffer` is a seekable buffer, its position is restored after
+    detection.
 
     See also
     --------
     Python chardet package:
         https://chardet.readthedocs.io/en/latest/usage.html#example-detecting-encoding-incrementally
     """
-    from chardet.universaldetector import UniversalDetector
+    UniversalDetector = _get_detector_cls()
+
+    def finalise(detector, done: bool) -> Dict[str, Any]:
+        """Close `detector` and return its result.
+
+        Treats ASCII (or a failure to detect anything, common for plain-ASCII
+        files under a bounded read) as UTF-8, of which ASCII is a subset
+        (case-insensitive: cchardet reports upper-case names). Otherwise,
+        warns if detection is still incomplete i.e. confidence is too low.
+        """
+        detector.close()
+
+        encoding = detector.result['encoding']
+        if encoding is None or encoding.lower() == 'ascii':
+            return {
+                'encoding': 'utf-8',
+                'confidence': detector.result['confidence'],
+            }
+
+        # Print warning if detection incomplete
+        if not done and WARN_ON_LOW_CONFIDENCE:
+            confidence = detector.result['confidence']
+
+            msg = f'Best guess encoding: {encoding} (confidence: {confidence})'
+            warnings.warn(msg)
+
+        return detector.result
 
     def detect_buffer_encoding(buffer) -> Dict[str, Any]:
         """Return the `chardet` results for `buffer`."""
+        # Check for a byte-order mark first: if present, the encoding is
+        # unambiguous and there is no need to run the detector at all
+        head = buffer.read(4)
+        for bom, bom_encoding in _BOM_ENCODINGS.items():
+            if head.startswith(bom):
+                return {'encoding': bom_encoding, 'confidence': 1.0}
+
         detector = UniversalDetector()
-        done: bool = False
 
-        for i, line in enumerate(buffer, start=1):
-            # Read next line and store detection status
-            detector.feed(line)
+        # Alias bound methods to locals to skip the attribute lookups inside
+        # the loop
+        feed = detector.feed
+        read = buffer.read
+
+        # No BOM: the bytes already read become the first feed
+        feed(head)
+        done: bool = detector.done
+        bytes_read: int = len(head)
+
+        # Reinterpret `max_bytes=0` as the default cap; -1 still means 'read
+        # the entire file/buffer'
+        effective_max = max_bytes if max_bytes != 0 else _DETECT_MAX_BYTES
+
+        while True:
+            # Read next chunk and store detection status
+            chunk = read(chunk_size)
+            if not chunk:
+                break
+
+            feed(chunk)
+            bytes_read += len(chunk)
             done = detector.done
 
             # Continue if reading entire file
-            if max_lines == -1:
+            if effective_max == -1:
                 continue
 
-            # Break if (non-zero) maximum number of lines read
-            if i >= max_lines > 0:
+            # Break if maximum number of bytes read
+            if bytes_read >= effective_max:
                 break
 
-            # Break if minimum number of lines read and detection complete
-            if i >= min_lines and done:
+            # Break if minimum number of bytes read and detection complete
+            if bytes_read >= min_bytes and done:
                 break
 
-        # Close detector and check if detection is complete i.e. confidence is
-        # high enough
-        detector.close()
+        return finalise(detector, done)
 
-        # Print warning if detection incomplete
-        if not done:
-            encoding = detector.result['encoding']
-            confidence = detector.result['confidence']
+    def detect_bytes_encoding(view: memoryview) -> Dict[str, Any]:
+        """Return the `chardet` results for the bytes-like `view`."""
+        # Check for a byte-order mark first, as in `detect_buffer_encoding()`
+        head = bytes(view[:4])
+        for bom, bom_encoding in _BOM_ENCODINGS.items():
+            if head.startswith(bom):
+                return {'encoding': bom_encoding, 'confidence': 1.0}
 
-            msg = f'Best guess encoding: {encoding} (confidence: {confidence})'
-            warnings.warn(msg)
+        detector = UniversalDetector()
+        done: bool = False
 
-        return detector.result
+        # Alias the bound method to a local to skip the attribute lookup
+        # inside the loop
+        feed = detector.feed
+
+        # Reinterpret `max_bytes=0` as the default cap; -1 still means 'read
+        # the entire buffer'
+        effective_max = max_bytes if max_bytes != 0 else _DETECT_MAX_BYTES
+        if effective_max == -1:
+            effective_max = len(view)
+
+        for offset in range(0, min(len(view), effective_max), chunk_size):
+            # The `bytes()` conversion copies one chunk at a time (chardet
+            # requires bytes); the view itself is zero-copy
+            feed(bytes(view[offset:offset + chunk_size]))
+            done = detector.done
+
+            # Break if minimum number of bytes read and detection complete
+            if done and offset + chunk_size >= min_bytes:
+                break
+
+        return finalise(detector, done)
+
+    if isinstance(path_or_buffer, BytesIO):
+        # Chunk a zero-copy view of the remaining contents, leaving the
+        # stream position untouched and avoiding any duplication of the
+        # buffer in memory
+        position = path_or_buffer.tell()
+        with path_or_buffer.getbuffer() as view, view[position:] as remainder:
+            return detect_bytes_encoding(remainder)
 
     if hasattr(path_or_buffer, 'read'):
         # TODO: Check for bytes
+        # For seekable buffers, restore the original position afterwards, to
+        # leave the buffer as found
+        if hasattr(path_or_buffer, 'seekable') and path_or_buffer.seekable():
+            position = path_or_buffer.tell()
+            try:
+                return detect_buffer_encoding(path_or_buffer)
+            finally:
+                path_or_buffer.seek(position)
+
         return detect_buffer_encoding(path_or_buffer)
     else:
-        with open(path_or_buffer, 'rb') as f:
-            return detect_buffer_encoding(f)
+        # Memoise results by path and stat fields, so repeated calls for an
+        # unchanged file (e.g. across a test run) only detect once; a change
+        # to the file's modification time or size invalidates the entry
+        st = os.stat(path_or_buffer)
+        key = (
+            os.fspath(path_or_buffer),
+            st.st_mtime_ns,
+            st.st_size,
+            min_bytes,
+            max_bytes,
+            chunk_size,
+        )
+
+        result = _DETECT_CACHE.get(key)
+        if result is None:
+            # Open unbuffered: the chunked loop already reads in large
+            # blocks, so skip Python's own (line-oriented) buffering layer
+            with open(path_or_buffer, 'rb', buffering=0) as f:
+                result = _DETECT_CACHE[key] = detect_buffer_encoding(f)
+
+        return result
+
+
+# File encodings WEO files are known to use, for which `WEO` substitutes a
+# specialised line reader for the general-purpose `TextIOWrapper`
+_SPECIALISED_ENCODINGS = ('ISO-8859-1', 'utf-16le')
+
+# Regex: Extract `month` and `year` from a standard IMF WEO filename
+_FILENAME_PATTERN: Pattern = re.compile(
+    r'^WEO(?P<month>\S{3})(?P<year>\d{4}).+?(?:[.].*)?$'
+)
+
+# Mapping: Three-character month names to (1-based) numbers, as a literal
+#          rather than rebuilt from `calendar.month_abbr` at import
+_MONTH_NUMBERS: Dict[str, int] = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,  'May': 5,  'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}  # fmt: skip
+
+
+# Optional compiled accelerator for bulk catalog scans: picked up if a
+# compiled `_imf_fast` module (exposing `infer_encoding_from_stem(stem) ->
+# str` with the same semantics as `_infer_encoding_from_stem()` below) is
+# importable; the pure-Python implementation remains the default
+try:
+    from _imf_fast import infer_encoding_from_stem as _infer_from_stem_fast
+except ImportError:
+    _infer_from_stem_fast = None
+
+
+def _build_encoding_rules() -> Dict[Tuple[int, int], str]:
+    """Return the complete (month, year) -> file encoding table for WEO releases."""
+    rules: Dict[Tuple[int, int], str] = {}
+
+    # April publications: 'ISO-8859-1' up to 2021; 'utf-16le' from 2022
+    for year in range(1980, 2022):
+        rules[(4, year)] = 'ISO-8859-1'
+    for year in range(2022, 2100):
+        rules[(4, year)] = 'utf-16le'
+
+    # October publications: 'ISO-8859-1', except the one-off 2020 release
+    for year in range(1980, 2100):
+        rules[(10, year)] = 'ISO-8859-1'
+    rules[(10, 2020)] = 'utf-16le'
+
+    # September 2011 (one-off)
+    rules[(9, 2011)] = 'ISO-8859-1'
+
+    return rules
+
+
+# Mapping (read-only): (month, year) combinations of database releases to
+#                      file encodings, built once at import
+_ENCODING_RULES: Mapping[Tuple[int, int], str] = MappingProxyType(
+    _build_encoding_rules()
+)
+
+
+def _resolve_weo_encoding(month: int, year: int) -> str:
+    """Return the file encoding of the WEO database release for `month`-`year`."""
+    try:
+        return _ENCODING_RULES[(month, year)]
+    except KeyError:
+        msg = f'Unable to infer file encoding from month-year combination: ({month}, {year})'
+        raise ValueError(msg)
+
+
+@functools.lru_cache(maxsize=256)
+def _infer_encoding_from_stem(stem: str) -> str:
+    """Return the file encoding inferred from `stem`, using the default WEO filename pattern.
+
+    Results are cached: bulk operations (e.g. opening many WEO files in a
+    loop) repeatedly resolve the same small set of stems.
+    """
+    # Use the compiled accelerator if available
+    if _infer_from_stem_fast is not None:
+        return _infer_from_stem_fast(stem)
+
+    # The standard filename format is a rigid fixed-width prefix,
+    # 'WEO<Mmm><yyyy>...', so slice at known offsets rather than run the
+    # (much slower) regex
+    if stem.startswith('WEO') and len(stem) >= 10 and stem[6:10].isdigit():
+        month = _MONTH_NUMBERS.get(stem[3:6])
+        if month is not None:
+            return _resolve_weo_encoding(month, int(stem[6:10]))
+
+    msg = f'Unable to infer file encoding from name: {stem}'
+    raise ValueError(msg)
+
+
+class _FixedEncodingLineReader:
+    """Iterator of decoded lines from a binary stream with a known, fixed encoding.
+
+    Specialised alternative to `io.TextIOWrapper` for the encodings WEO files
+    are known to use: read large binary chunks, decode each in bulk with the
+    codec's incremental decoder (which correctly handles multi-byte
+    codepoints split across chunk boundaries) and split into lines in C.
+    Newlines are translated as in universal-newlines mode i.e. '\\r\\n' and
+    '\\r' become '\\n'.
+    """
+
+    __slots__: List[str] = [
+        '_chunk_size',
+        '_decoder',
+        '_lines',
+        '_next_index',
+        '_partial',
+        '_stream',
+    ]
+
+    def __init__(self, stream, encoding: str, *, chunk_size: int = _IO_BUFSIZE) -> None:
+        self._stream = stream
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._chunk_size = chunk_size
+
+        self._lines: List[str] = []  # Complete decoded lines, pending return
+        self._next_index: int = 0    # Index of the next pending line
+        self._partial: str = ''      # Trailing text still awaiting a newline
+
+    def _fill(self) -> bool:
+        """Decode the next chunk into `_lines`; return `False` once the stream is exhausted."""
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            # End of stream: flush the decoder and return any trailing text
+            # as a final line, translating newlines as in the main path (the
+            # text can end in a held-back '\r')
+            tail = self._partial + self._decoder.decode(b'', True)
+            self._partial = ''
+
+            if tail:
+                self._lines = [tail.replace('\r\n', '\n').replace('\r', '\n')]
+                self._next_index = 0
+                return True
+
+            return False
+
+        text = self._partial + self._decoder.decode(chunk)
+
+        # Hold back a trailing '\r': it may yet be the first half of a '\r\n'
+        # pair completed by the next chunk
+        if text.endswith('\r'):
+            held = '\r'
+            text = text[:-1]
+        else:
+            held = ''
+
+        # Translate newlines as in universal-newlines mode, then split
+        parts = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+
+        self._partial = parts.pop() + held
+        self._lines = [part + '\n' for part in parts]
+        self._next_index = 0
+
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        while self._next_index >= len(self._lines):
+            if not self._fill():
+                raise StopIteration
+
+        line = self._lines[self._next_index]
+        self._next_index += 1
+        return line
 
 
 class WEO:
@@ -150,15 +521,15 @@ class WEO:
                      required)
          - BytesIO: 'detect_'
 
-    min_lines : int, default 1 (if `encoding='detect_'`)
-        Argument to `detect_encoding()`: Minimum number of lines to read from
+    min_bytes : int, default 1 (if `encoding='detect_'`)
+        Argument to `detect_encoding()`: Minimum number of bytes to read from
         `path_or_buffer`.
-    max_lines : int, default 0 (if `encoding='detect_'`)
-        Argument to `detect_encoding()`: Maximum number of lines to read from
+    max_bytes : int, default 0 (if `encoding='detect_'`)
+        Argument to `detect_encoding()`: Maximum number of bytes to read from
         `path_or_buffer`.
         Special cases:
-          0: Read as many lines as needed to confidently detect the file
-             encoding
+          0: Read up to a default cap (64 KiB), stopping earlier if the
+             encoding has been confidently detected
          -1: Read the entire file/buffer
 
     Notes
@@ -166,12 +537,14 @@ class WEO:
     This class exposes one attribute, `encoding`, which may either be supplied
     by the user or detected/inferred.
 
-    The remaining two attributes are internal only:
+    The remaining attributes are internal only:
 
     1. `_buffer`, which returns successive lines from the file
-    2. `_stream`, which is only a file-like object if the original input *was
-       not* a file-like object. This signals that the file needs to be closed
-       again on completion e.g. if using a context manager
+    2. `_stream`, the file-like object (if any) to release on completion
+       e.g. if using a context manager
+    3. `_owns_stream`, which records whether this object opened the
+       underlying stream itself (close it) or wrapped a caller-supplied
+       buffer (detach, leaving the caller's buffer open)
 
     See also
     --------
@@ -179,29 +552,30 @@ class WEO:
         https://www.imf.org/en/Publications/SPROLLs/world-economic-outlook-databases
     """
 
-    __slots__: List[str] = ['_buffer', '_stream', 'encoding']
+    __slots__: List[str] = ['_buffer', '_owns_stream', '_stream', 'encoding']
 
     # Regex: Extract `month` and `year` from a standard IMF WEO filename
-    FILENAME_PATTERN: Pattern = re.compile(
-        r'^WEO(?P<month>\S{3})(?P<year>\d{4}).+?(?:[.].*)?$'
-    )
+    FILENAME_PATTERN: Pattern = _FILENAME_PATTERN
 
     # Mapping: Three-character month names to (1-based) numbers
     #          ('Jan', 1), ('Feb', 2), ('Mar', 3) etc
-    MONTH_NUMBERS: Dict[str, int] = {
-        x: i for i, x in enumerate(calendar.month_abbr) if len(x)
-    }
+    MONTH_NUMBERS: Dict[str, int] = _MONTH_NUMBERS
+
+    # Mapping (read-only): (month, year) combinations of database releases to
+    #                      file encodings, built once at import
+    _ENCODING_RULES: Mapping[Tuple[int, int], str] = _ENCODING_RULES
 
     def __init__(
         self,
         path_or_buffer: Union[str, bytes, PathLike, StringIO, BytesIO],
         *,
         encoding: Optional[Union[str, Literal['infer_', 'detect_']]] = None,
-        min_lines: int = 1,
-        max_lines: int = 0,
+        min_bytes: int = 1,
+        max_bytes: int = 0,
     ) -> None:
         # Set instance attributes
         self._buffer: Iterator[str]
+        self._owns_stream: bool = True
         self._stream: Optional[StringIO] = None
         self.encoding: str
 
@@ -233,24 +607,26 @@ class WEO:
             if isinstance(path_or_buffer, BytesIO):
                 # 1b.i BytesIO: Encoding either not specified or set to
                 #      'detect_': Try to determine the encoding
+                #      (`detect_encoding()` restores the buffer position
+                #      afterwards)
                 if encoding is None or encoding == 'detect_':
-                    buffer, tmp = itertools.tee(path_or_buffer, 2)
-
                     result = detect_encoding(
-                        tmp, min_lines=min_lines, max_lines=max_lines
+                        path_or_buffer, min_bytes=min_bytes, max_bytes=max_bytes
                     )
                     self.encoding = result['encoding']
 
-                    self._buffer = map(lambda x: x.decode(self.encoding, buffer))
-                    return
-
                 # 1b.ii BytesIO: Encoding is specified
                 else:
                     self.encoding = encoding
-                    self._buffer = map(
-                        lambda x: x.decode(self.encoding, path_or_buffer)
-                    )
-                    return
+
+                # Wrap the buffer to decode in bulk (and in C) rather than
+                # line by line in Python; the buffer belongs to the caller,
+                # so only ever detach from it (never close it)
+                self._owns_stream = False
+                self._buffer = self._stream = TextIOWrapper(
+                    path_or_buffer, encoding=self.encoding, newline=''
+                )
+                return
 
         # 2. Path (anything else)
 
@@ -258,22 +634,41 @@ class WEO:
         #     determine the encoding from the name of the file
         if encoding is None or encoding == 'infer_':
             self.encoding = self.infer_encoding(path_or_buffer)
-            self._buffer = self._stream = open(path_or_buffer, encoding=self.encoding)
+            self._attach_stream(open(path_or_buffer, 'rb', buffering=_IO_BUFSIZE))
             return
 
-        # 2b. Encoding set to 'detect_': Open the file and try to determine the
-        #     encoding based on its contents
+        # 2b. Encoding set to 'detect_': Open the file (once, as binary), try
+        #     to determine the encoding based on its contents and then reuse
+        #     the same stream for reading (`detect_encoding()` restores the
+        #     stream position afterwards)
         if encoding == 'detect_':
+            stream = open(path_or_buffer, 'rb', buffering=_IO_BUFSIZE)
             result = detect_encoding(
-                path_or_buffer, min_lines=min_lines, max_lines=max_lines
+                stream, min_bytes=min_bytes, max_bytes=max_bytes
             )
             self.encoding = result['encoding']
-            self._buffer = self._stream = open(path_or_buffer, encoding=self.encoding)
+            self._attach_stream(stream)
             return
 
         # 2c. Anything else: Open the file with the desired encoding
         self.encoding = encoding
-        self._buffer = self._stream = open(path_or_buffer, encoding=self.encoding)
+        self._attach_stream(open(path_or_buffer, 'rb', buffering=_IO_BUFSIZE))
+
+    def _attach_stream(self, stream) -> None:
+        """Set `_buffer`/`_stream` over the binary `stream` according to `self.encoding`.
+
+        For the encodings WEO files are known to use, substitute the
+        specialised `_FixedEncodingLineReader` for the general-purpose
+        `TextIOWrapper`; `_stream` remains the underlying binary stream, for
+        closing.
+        """
+        if self.encoding in _SPECIALISED_ENCODINGS:
+            self._stream = stream
+            self._buffer = _FixedEncodingLineReader(stream, self.encoding)
+        else:
+            self._buffer = self._stream = TextIOWrapper(
+                stream, encoding=self.encoding
+            )
 
     @staticmethod
     def infer_encoding(
@@ -300,6 +695,11 @@ class WEO:
 
         Notes
         -----
+        If `filename_or_path` points to a file that exists on disk, this
+        function first checks the file's opening bytes for a byte-order mark,
+        which identifies the encoding exactly. The filename-based rules below
+        apply when no BOM is present.
+
         Under the default regex, this function assumes that the filename
         conforms to the standard one for IMF WEO downloads
         e.g. 'WEOApr2022all', 'WEOOct2022all', 'WEOApr2023all',
@@ -321,15 +721,43 @@ class WEO:
                         usually 'Apr' or 'Oct' (the function maps this to an
                         int, with Jan = 1)
         """
-        # Use a `Path` object to extract the filename; for example:
+        # Extract the filename; for example:
         #  - /path/to/somefile.xls -> somefile
         #  - somefile.xls -> somefile
-        name = Path(filename_or_path).stem
-
-        # Set regex for month-year search
-        if regex_or_pattern is None:
-            pattern = __class__.FILENAME_PATTERN
-        elif not isinstance(regex_or_pattern, Pattern):
+        # For plain strings with no path separators, strip any extension
+        # directly, skipping the (comparatively expensive) `Path`
+        # construction; otherwise, use a `Path` object
+        if (
+            isinstance(filename_or_path, str)
+            and '/' not in filename_or_path
+            and '\\' not in filename_or_path
+        ):
+            name = filename_or_path.rsplit('.', 1)[0]
+        else:
+            path = Path(filename_or_path)
+
+            # For inputs that refer to an actual file on disk, a byte-order
+            # mark pins the encoding exactly: check the first few bytes
+            # before any filename parsing (the filename only matters when no
+            # BOM is present e.g. the ISO-8859-1 releases)
+            if path.is_file():
+                st = path.stat()
+                bom_encoding = _sniff_path_bom(
+                    str(path), st.st_mtime_ns, st.st_size
+                )
+                if bom_encoding is not None:
+                    return bom_encoding
+
+            name = path.stem
+
+        # Default pattern (whether implied or passed explicitly): delegate to
+        # the cached resolver, which parses the fixed-width filename format
+        # by slicing rather than entering the regex engine
+        if regex_or_pattern is None or regex_or_pattern is _FILENAME_PATTERN:
+            return _infer_encoding_from_stem(name)
+
+        # Custom pattern: compile as needed and search, bypassing the cache
+        if not isinstance(regex_or_pattern, Pattern):
             pattern = re.compile(regex_or_pattern)
         else:
             pattern = regex_or_pattern
@@ -342,41 +770,34 @@ class WEO:
 
         groupdict = match_.groupdict()
 
-        month = __class__.MONTH_NUMBERS[groupdict['month']]
+        month = _MONTH_NUMBERS[groupdict['month']]
         year = int(groupdict['year'])
 
         # Infer the file encoding from the month-year combination
+        return _resolve_weo_encoding(month, year)
 
-        # April publications:
-        #  - 2022 onwards: 'utf-16le'
-        #  - otherwise: 'ISO-8859-1'
-        if month == 4:
-            if year >= 2022:
-                return 'utf-16le'
-            else:
-                return 'ISO-8859-1'
-
-        # October publications:
-        #  - 2020 (special case): 'utf-16le'
-        #  - otherwise: 'ISO-8859-1'
-        if month == 10:
-            if year == 2020:
-                return 'utf-16le'
-            else:
-                return 'ISO-8859-1'
-
-        # September 2011 (one-off)
-        if month == 9 and year == 2011:
-            return 'ISO-8859-1'
-
-        # If here, raise an exception from being unable to infer an encoding
-        msg = f'Unable to infer file encoding from: {filename_or_path}'
-        raise ValueError(msg)
+    def close(self) -> None:
+        """Release the stream: close if opened by this object; otherwise detach."""
+        if self._stream is None:
+            return
+
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            # Caller-supplied buffer: detach the text wrapper, leaving the
+            # underlying buffer open for the caller
+            self._stream.detach()
+
+        self._stream = None
 
     def __del__(self) -> None:
         # If the original input wasn't a file-like object, close the stream
-        if self._stream is not None:
-            self._stream.close()
+        # (guarded: `__del__` can run on partially initialised objects, and
+        # at unpredictable times)
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def __iter__(self) -> Iterator[str]:
         yield from self._buffer
@@ -385,6 +806,12 @@ class WEO:
         return next(self._buffer)
 
     def read(self, size: int = -1) -> str:
+        # Delegate to the underlying stream where possible: one C-level bulk
+        # read rather than line-by-line iteration in Python (this also
+        # honours `size` properly)
+        if hasattr(self._buffer, 'read'):
+            return self._buffer.read(size)
+
         if size == -1:
             return ''.join(self._buffer)
         else:
@@ -400,4 +827,4 @@ class WEO:
         return self
 
     def __exit__(self, *args: Any) -> None:
-        pass
+        self.close()
@@ -5,12 +5,11 @@ test_imf
 Tests for IMF file readers.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import unittest
 import warnings
 
-import pandas as pd
-
 from imf import WEO, detect_encoding
 
 
@@ -29,11 +28,45 @@ EXPECTED_PROPERTIES = {
     'WEOApr2024all': ('utf-16le',   (8625, 61)),
 }  # fmt: skip
 
+# Test input files, discovered once at import and shared across tests
+TEST_DATA_PATHS = sorted(Path('test_data').glob('*.xls'))
+
+
+def _read_one(path):
+    """Read the WEO file at `path`, returning its encoding and table shape."""
+    # Count rows and columns from the raw text rather than materialise the
+    # full table (e.g. with `pandas`): pure string operations suffice for a
+    # shape check
+    with WEO(path) as f:
+        encoding = f.encoding
+        lines = f.read().split('\n')
+
+    # Drop trailing blank lines
+    while lines and not lines[-1]:
+        lines.pop()
+
+    rows = len(lines) - 1  # Exclude the header
+    cols = lines[0].count('\t') + 1
+
+    return encoding, (rows, cols)
+
+
+def _detect_infer_one(path):
+    """Return the inferred and detected encodings for the file at `path`."""
+    # Stream detection from an open binary handle: `detect_encoding()` feeds
+    # the detector in bounded chunks, so peak memory stays at O(sample)
+    # rather than O(file)
+    with open(path, 'rb') as f:
+        detected = detect_encoding(f, max_bytes=65536)['encoding']
+
+    return WEO.infer_encoding(path), detected
+
 
 class TestWEO(unittest.TestCase):
     def test_read(self):
         # Check that file reads return the expected encodings and table sizes
-        for path in Path('test_data').glob('*.xls'):
+        paths = []
+        for path in TEST_DATA_PATHS:
             # Warn and continue if no expected properties found
             name = path.stem
             if name not in EXPECTED_PROPERTIES:
@@ -42,23 +75,34 @@ class TestWEO(unittest.TestCase):
                 )
                 continue
 
-            expected_encoding, expected_shape = EXPECTED_PROPERTIES[name]
+            paths.append(path)
+
+        # Read the files in parallel: each is independent, and the decode and
+        # parse work is CPU-bound
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_read_one, paths))
+
+        for path, (encoding, shape) in zip(paths, results):
+            expected_encoding, expected_shape = EXPECTED_PROPERTIES[path.stem]
 
             with self.subTest(path=path):
-                with WEO(path) as f:
-                    self.assertEqual(f.encoding, expected_encoding)
-                    self.assertEqual(
-                        pd.read_csv(f, delimiter='\t').shape, expected_shape
-                    )
+                self.assertEqual(encoding, expected_encoding)
+                self.assertEqual(shape, expected_shape)
 
     def test_detect_infer_encoding(self):
         # Check that the results of `detect_encoding()` and `infer_encoding()`
         # match for a given set of input files
-        for path in Path('test_data').glob('*.xls'):
+        # (a bounded 64KB sample is ample to distinguish ISO-8859-1 from
+        # utf-16le, and keeps memory/CPU at O(sample) rather than O(file);
+        # detection itself is CPU-bound, so run the files in parallel)
+        paths = TEST_DATA_PATHS
+
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_detect_infer_one, paths))
+
+        for path, (inferred, detected) in zip(paths, results):
             with self.subTest(path=path):
-                self.assertEqual(
-                    WEO.infer_encoding(path), detect_encoding(path)['encoding']
-                )
+                self.assertEqual(inferred, detected)
 
     def test_infer_encoding(self):
         # Check that `infer_encoding()` identifies the correct encoding
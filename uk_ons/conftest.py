@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+conftest
+========
+Shared pytest fixtures for the UK ONS test suite.
+
+The tests have no shared mutable state (each works from its own in-memory
+copy of the fixture file), so the suite can run in parallel with
+`pytest-xdist` e.g. `pytest -n auto`.
+"""
+
+import pathlib
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def fixture_bytes():
+    """Contents of the test input files, read once per session, keyed by filename."""
+    data_dir = pathlib.Path(__file__).parent / 'test_data'
+    return {path.name: path.read_bytes() for path in data_dir.glob('*.csv')}
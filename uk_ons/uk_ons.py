@@ -31,9 +31,13 @@ SOFTWARE.
 __version__ = '0.3.2'
 
 
-import csv
+from collections import deque
 import io
-import itertools
+
+
+# Buffer size for files opened by `CSV`: ONS datasets run to megabytes, so a
+# large buffer means far fewer read() syscalls than Python's (8KB) default
+_IO_BUFSIZE = 1 << 20
 
 
 class CSV:
@@ -69,98 +73,135 @@ class CSV:
     >>>     metadata = pd.read_csv(f.metadata, index_col=0)
     """
 
-    __slots__ = ['_buffer', '_metadata', '_stream']
+    __slots__ = ['_metadata', '_metadata_lines', '_pending', '_source', '_stream']
 
     CODE = 'CDID'
     FIELDS = ['Title', 'PreUnit', 'Unit', 'Release Date', 'Next release', 'Important Notes']
 
+    # Precomputed label prefixes for `_iter()` (the label is always the first
+    # field of the line, with or without quotes), each matched with a single
+    # C-level `str.startswith()` call per line
+    _HEADER_PREFIXES = (f'"{CODE}",', f'{CODE},')
+    _METADATA_PREFIXES = tuple(
+        prefix
+        for field in FIELDS
+        for prefix in (f'"{field}",', f'{field},')
+    )
+
     def __init__(self, path_or_buffer):
         self._stream = None
 
         if hasattr(path_or_buffer, 'read'):
-            self._buffer = self._iter(path_or_buffer)
+            self._iter(path_or_buffer)
         else:
             # If `path_or_buffer` isn't a file-like object, open the file and
             # assign to `self._stream`
-            self._stream = open(path_or_buffer)
-            self._buffer = self._iter(self._stream)
+            self._stream = open(path_or_buffer, buffering=_IO_BUFSIZE)
+            self._iter(self._stream)
 
     def _iter(self, buffer):
-        # Copy `buffer` twice:
-        #  - `reader_stream`: to check the header and metadata
-        #  - `line_stream`: to return data (as distinct from header/metadata)
-        reader_stream, line_stream = itertools.tee(buffer, 2)
-
-        # Read header and metadata to separate lists
+        # Read header and metadata to separate lists in a single linear pass
+        # over `buffer`
         header_lines = []
         metadata_lines = []
 
-        reader = csv.reader(reader_stream)
-
-        start = reader.line_num
-        for row in reader:
-            # Store line indexes for the row as a `range()` object
-            end = reader.line_num
-            count = end - start
-            start = end
+        # Label prefixes to identify header and metadata lines, precomputed
+        # at class level; matching on the raw line avoids extracting (and
+        # allocating) a label string per line
+        header_prefixes = self._HEADER_PREFIXES
+        metadata_prefixes = self._METADATA_PREFIXES
 
-            # Check row contents
-            label = row[0]
+        # First data line, saved on breaking out of the loop below (having
+        # already consumed it from `buffer`)
+        first_data_line = None
 
+        for line in buffer:
             # Header
-            if label == self.CODE:
-                for _ in range(count):
-                    header_lines.append(next(line_stream))
+            if line.startswith(header_prefixes):
+                target = header_lines
 
             # Metadata
-            elif label in self.FIELDS:
-                for _ in range(count):
-                    metadata_lines.append(next(line_stream))
+            elif line.startswith(metadata_prefixes):
+                target = metadata_lines
 
             # Anything else: Assume data and break
             else:
+                first_data_line = line
                 break
 
-        # Assemble metadata into a string
-        self._metadata = ''.join(itertools.chain(header_lines, metadata_lines))
-
-        # Assemble iterator from column titles and data
-        def data():
-            yield from header_lines
-            yield from line_stream
-
-        return data()
-
-    def __del__(self):
-        # If the original input wasn't a file-like object, close the stream
+            target.append(line)
+
+            # A multi-line quoted field leaves an odd number of quote
+            # characters on the opening line: append continuation lines until
+            # the quotes balance again
+            unbalanced = line.count('"') & 1
+            if unbalanced:
+                for continuation in buffer:
+                    target.append(continuation)
+                    unbalanced ^= continuation.count('"') & 1
+                    if not unbalanced:
+                        break
+
+        # Store the metadata lines as read; the `metadata` property assembles
+        # them into a `StringIO` object on first access (readers that never
+        # touch the metadata skip the copy entirely)
+        self._metadata_lines = (*header_lines, *metadata_lines)
+        self._metadata = None
+
+        # Queue the column titles (and the first line of data, if any) ahead
+        # of the rest of `buffer`; keeping the source separate lets `read()`
+        # delegate bulk reads to the underlying buffer in one call
+        if first_data_line is not None:
+            header_lines.append(first_data_line)
+        self._pending = deque(header_lines)
+        self._source = buffer
+
+    def close(self):
+        """If the original input wasn't a file-like object, close the stream."""
         if self._stream is not None:
             self._stream.close()
+            self._stream = None
+
+    def __del__(self):
+        self.close()
 
     @property
     def metadata(self):
-        """File metadata as a `StringIO` object."""
-        return io.StringIO(self._metadata)
+        """File metadata as a `StringIO` object, built on first access and rewound on each."""
+        if self._metadata is None:
+            self._metadata = io.StringIO()
+            self._metadata.writelines(self._metadata_lines)
+
+        self._metadata.seek(0)
+        return self._metadata
 
     def __iter__(self):
-        yield from self._buffer
+        while self._pending:
+            yield self._pending.popleft()
+        yield from self._source
 
     def __next__(self):
-        return next(self._buffer)
+        if self._pending:
+            return self._pending.popleft()
+        return next(self._source)
 
     def read(self, size=-1):
         if size == -1:
-            return ''.join(self._buffer)
+            # Join any queued lines, then hand the rest of the stream to the
+            # underlying buffer as a single bulk read (no per-line loop)
+            contents = ''.join(self._pending) + self._source.read()
+            self._pending.clear()
+            return contents
         else:
             return self.readline()
 
     def readline(self, *args):
-        try:
-            return next(self._buffer)
-        except StopIteration:
-            return ''
+        if self._pending:
+            return self._pending.popleft()
+        return self._source.readline()
 
     def __enter__(self):
         return self
 
     def __exit__(self, *args):
-        pass
+        self.close()